@@ -1,23 +1,22 @@
 """An MCP client for the Agno SSE demo."""
 
 import asyncio
-import os
-from dotenv import load_dotenv
-import openai
 
-from agno.agent import Agent
-from agno.models.openai import OpenAIChat
-from agno.tools.mcp import MCPTools
+from .utils import load_env, make_http_client, run_async
 
-load_dotenv()
-openai.api_key = os.getenv("OPENAI_API_KEY")
+load_env()
 
 
 async def main():
     """Connects to an MCP server and uses it to run an agent."""
-    server_url = "http://127.0.0.1:8008/sse"
-    async with MCPTools(url=server_url, transport="sse") as mcp_tools:
-        agent = Agent(model=OpenAIChat(id="gpt-4o"), tools=[mcp_tools])
+    from agno.agent import Agent
+    from agno.models.openai import OpenAIChat
+    from agno.tools.mcp import MCPTools
+
+    # `mcp-sse` also serves the Streamable HTTP transport on /mcp.
+    server_url = "http://127.0.0.1:8008/mcp"
+    async with make_http_client() as http_client, MCPTools(url=server_url, transport="streamable-http") as mcp_tools:
+        agent = Agent(model=OpenAIChat(id="gpt-4o", http_client=http_client), tools=[mcp_tools])
 
         prompts = [
             "Call the 'about_info' tool.",
@@ -26,10 +25,13 @@ async def main():
             "Call 'dependency_scan' on path '../'.",
         ]
 
-        for prompt in prompts:
+        # Run every prompt concurrently; the LLM round-trips dominate, so the
+        # whole batch takes about as long as the slowest prompt.
+        responses = await asyncio.gather(*(agent.arun(prompt) for prompt in prompts))
+        for prompt, response in zip(prompts, responses):
             print(f"\n--- Prompt: {prompt} ---")
-            await agent.aprint_response(prompt, stream=True)
+            print(response.content)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_async(main())
@@ -1,36 +1,49 @@
 """A demo of the Agno MCP tools with a stdio transport."""
 
 import asyncio
-import os
-from dotenv import load_dotenv
-import openai
 
+from .utils import load_env, make_http_client, run_async, warm_openai
 
-from agno.agent import Agent
-from agno.models.openai import OpenAIChat
-from agno.tools.mcp import MCPTools
-
-
-load_dotenv()
-openai.api_key = os.getenv("OPENAI_API_KEY")
+load_env()
 
 
 async def main():
     """Fetches tools from a subprocess and uses them to run an agent."""
-    async with MCPTools(command="uv run mcp-stdio") as mcp_tools:
-        agent = Agent(model=OpenAIChat(id="gpt-4.1"), tools=[mcp_tools])
-
-        prompts = [
-            "Call the 'about_info' tool.",
-            "Call 'analysis_scan' on path '../' with display 'matrix'.",
-            "Call 'security_scan' on path '../'.",
-            "Call 'dependency_scan' on path '../'.",
-        ]
-
-        for prompt in prompts:
-            print(f"\n--- Prompt: {prompt} ---")
-            await agent.aprint_response(prompt, stream=True)
+    from agno.agent import Agent
+    from agno.models.openai import OpenAIChat
+    from agno.tools.mcp import MCPTools
+    from mcp import StdioServerParameters
+
+    async with make_http_client() as http_client:
+        # Open the OpenAI connection while the MCP subprocess starts up.
+        warm_up = asyncio.create_task(warm_openai(http_client))
+        try:
+            # Agno only accepts whitelisted launchers (uv, python, npx...) in a
+            # command string; passing the parameters directly runs the
+            # binary without going through `uv run` first.
+            async with MCPTools(server_params=StdioServerParameters(command="mcp-stdio")) as mcp_tools:
+                await warm_up
+                agent = Agent(model=OpenAIChat(id="gpt-4.1", http_client=http_client), tools=[mcp_tools])
+
+                prompts = [
+                    "Call the 'about_info' tool.",
+                    "Call 'analysis_scan' on path '../' with display 'matrix'.",
+                    "Call 'security_scan' on path '../'.",
+                    "Call 'dependency_scan' on path '../'.",
+                ]
+
+                # Run every prompt concurrently; the LLM round-trips dominate, so the
+                # whole batch takes about as long as the slowest prompt.
+                responses = await asyncio.gather(*(agent.arun(prompt) for prompt in prompts))
+                for prompt, response in zip(prompts, responses):
+                    print(f"\n--- Prompt: {prompt} ---")
+                    print(response.content)
+        finally:
+            # If the subprocess failed to start, the warm-up may still be
+            # running; stop it before the client it uses is closed.
+            warm_up.cancel()
+            await asyncio.gather(warm_up, return_exceptions=True)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run_async(main())
\ No newline at end of file
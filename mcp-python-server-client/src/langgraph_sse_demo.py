@@ -2,45 +2,75 @@
 
 import asyncio
 import os
-from dotenv import load_dotenv
+import sys
 
-from langchain_mcp_adapters.client import MultiServerMCPClient
-from langgraph.prebuilt import create_react_agent
-import openai
+from .response_cache import cache_key, cached_astream, hit_note
+from .utils import cached_get_tools, load_env, make_http_client, parse_cache_args, run_async
 
-load_dotenv()
-openai.api_key = os.getenv("OPENAI_API_KEY")
+load_env()
 
-async def main():
-    # ← Use /sse here, since `mcp-sse` prints "Server is available at .../sse"
+MODEL = "gpt-4o"
+
+PROMPTS = [
+    ("about_info",     "Call the 'about_info' tool."),
+    ("analysis_scan",  "Call the 'analysis_scan' tool on path '../' with display 'matrix'."),
+    ("vulnerability_scan",  "Call the 'vulnerability_scan' tool on path '../'."),
+    ("security_scan",  "Call the 'security_scan' tool on path '../'."),
+    ("dependency_scan","Call the 'dependency_scan' tool on path '../'."),
+]
+
+# The agent inputs never change, so build them once up front.
+INPUTS = [(name, {"messages": [{"role": "user", "content": prompt}]}) for name, prompt in PROMPTS]
+
+
+async def stream_prompt(agent, name, payload, key, use_cache, refresh):
+    """Writes each new message of one prompt's run to stdout as it arrives."""
+    async def note_hit(age):
+        sys.stdout.write(f"\n--- {name}: {hit_note(age)} ---\n")
+
+    seen = len(payload["messages"])
+    async for state in cached_astream(
+        agent, payload, key, use_cache=use_cache, refresh=refresh, stream_mode="values", on_hit=note_hit
+    ):
+        messages = state["messages"]
+        for message in messages[seen:]:
+            text = message.text()
+            if text:
+                sys.stdout.write(f"\n--- {name} ({message.type}) ---\n{text}\n")
+        sys.stdout.flush()
+        seen = len(messages)
+
+
+async def main(refresh=False, use_cache=True):
+    from langchain_mcp_adapters.client import MultiServerMCPClient
+    from langchain_openai import ChatOpenAI
+    from langgraph.prebuilt import create_react_agent
+
+    # `mcp-sse` also serves the Streamable HTTP transport on /mcp, which
+    # avoids the separate SSE stream and POST endpoint round-trips.
     client = MultiServerMCPClient({
         "demo": {
-            "url": "http://127.0.0.1:8008/sse",
-            "transport": "sse",
+            "url": "http://127.0.0.1:8008/mcp",
+            "transport": "streamable_http",
         }
     })
 
-    tools = await client.get_tools()
-    print(f"Fetched {len(tools)} tools from MCP server:")
-    for t in tools:
-        print(f" • {t.name}")
-
-    agent = create_react_agent("openai:gpt-4o", tools)
+    tools = await cached_get_tools(client, "demo", refresh=refresh)
+    tool_names = [t.name for t in tools]
+    if os.environ.get("MCP_VERBOSE"):
+        sys.stdout.write(f"Fetched {len(tools)} tools from MCP server:\n" + "".join(f" • {name}\n" for name in tool_names))
+    else:
+        print(f"Fetched {len(tools)} tools from MCP server.")
 
-    prompts = [
-        ("about_info",     "Call the 'about_info' tool."),
-        ("analysis_scan",  "Call the 'analysis_scan' tool on path '../' with display 'matrix'."),
-        ("vulnerability_scan",  "Call the 'vulnerability_scan' tool on path '../'."),
-        ("security_scan",  "Call the 'security_scan' tool on path '../'."),
-        ("dependency_scan","Call the 'dependency_scan' tool on path '../'."),
-    ]
+    async with make_http_client() as http_client:
+        agent = create_react_agent(ChatOpenAI(model=MODEL, http_async_client=http_client), tools)
 
-    for name, prompt in prompts:
-        print(f"\n--- Invoking {name} ---")
-        resp = await agent.ainvoke({
-            "messages": [{"role": "user", "content": prompt}]
-        })
-        print(resp)
+        # Fan the prompts out concurrently; each streams its messages as they come.
+        await asyncio.gather(*(
+            stream_prompt(agent, name, payload, cache_key(payload, MODEL, tool_names), use_cache, refresh)
+            for name, payload in INPUTS
+        ))
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    args = parse_cache_args()
+    run_async(main(refresh=args.refresh, use_cache=args.use_cache))
@@ -2,20 +2,85 @@
 
 import asyncio
 import os
-from dotenv import load_dotenv
+import sys
 from collections import namedtuple
 
-from langchain_mcp_adapters.client import MultiServerMCPClient
-from langgraph.prebuilt import create_react_agent
-import openai
+from .response_cache import cache_key, cached_astream, hit_note
+from .utils import (
+    cached_get_tools,
+    load_env,
+    make_http_client,
+    parse_cache_args,
+    render_utility_result_async,
+    run_async,
+    warm_openai,
+)
 
-from .utils import render_utility_result
+load_env()
 
-load_dotenv()
-openai.api_key = os.getenv("OPENAI_API_KEY")
 
+TextContent = namedtuple('TextContent', ['text'])
+ToolResult = namedtuple('ToolResult', ['content', 'isError'])
+
+MODEL = "gpt-4.1"
+
+TESTS = [
+    ("about_info",    "Call the 'about_info' tool."),
+    ("analysis_scan", "Call 'analysis_scan' on path '../' with display 'matrix'."),
+    ("security_scan", "Call 'security_scan' on path '../'."),
+    ("dependency_scan","Call 'dependency_scan' on path '../'."),
+]
+
+# Held while a test prints its output, so concurrent tests don't interleave.
+output_lock = asyncio.Lock()
+
+# The agent inputs never change, so build them once up front.
+INPUTS = [
+    (name, prompt, {"messages": [{"role": "user", "content": prompt}]})
+    for name, prompt in TESTS
+]
+
+
+async def run_test(agent, name, prompt, payload, key, use_cache, refresh):
+    """Streams one test through the agent, rendering tool output as it arrives."""
+    header = f"\n--- {name} → {prompt}"
+    saw_tool = False
+    agent_final_response = None
+
+    async def note_hit(age):
+        async with output_lock:
+            print(f"\n--- {name}: {hit_note(age)}", flush=True)
+
+    # Stream through the agent's steps (replayed from the cache on a hit)
+    async for chunk in cached_astream(agent, payload, key, use_cache=use_cache, refresh=refresh, on_hit=note_hit):
+        if "tools" in chunk:
+            # Render each report as soon as it arrives instead of holding
+            # them all until the run finishes. The render runs in a thread so
+            # the other tests keep streaming meanwhile.
+            for msg in chunk["tools"]["messages"]:
+                async with output_lock:
+                    print(header, flush=True)
+                    await render_utility_result_async(ToolResult(content=[TextContent(text=msg.content)], isError=False))
+            saw_tool = True
+        if "agent" in chunk:
+            # The agent's message is the latest one in the list
+            message = chunk["agent"]["messages"][-1]
+            # If it's a final response (no more tool calls), we save it.
+            if not message.tool_calls:
+                agent_final_response = message
+
+    if not saw_tool and agent_final_response:
+        # Only if no tool was called, print the agent's response.
+        async with output_lock:
+            print(header)
+            print(agent_final_response.content, flush=True)
+
+
+async def main(refresh=False, use_cache=True):
+    from langchain_mcp_adapters.client import MultiServerMCPClient
+    from langchain_openai import ChatOpenAI
+    from langgraph.prebuilt import create_react_agent
 
-async def main():
     client = MultiServerMCPClient({
         "syncable_cli": {
             # Adjust this path if needed—just needs to point
@@ -27,49 +92,26 @@ async def main():
         }
     })
 
-    tools = await client.get_tools()
-    print(f"Fetched {len(tools)} tools:")
-    for t in tools:
-        print(f" • {t.name}")
-
-    agent = create_react_agent("openai:gpt-4.1", tools)
-
-    tests = [
-        ("about_info",    "Call the 'about_info' tool."),
-        ("analysis_scan", "Call 'analysis_scan' on path '../' with display 'matrix'."),
-        ("security_scan", "Call 'security_scan' on path '../'."),
-        ("dependency_scan","Call 'dependency_scan' on path '../'."),
-    ]
-
-    TextContent = namedtuple('TextContent', ['text'])
-    ToolResult = namedtuple('ToolResult', ['content', 'isError'])
-
-    for name, prompt in tests:
-        print(f"\n--- {name} → {prompt}")
-        tool_outputs = []
-        agent_final_response = None
-
-        # Stream through the agent's steps
-        async for chunk in agent.astream({"messages": [{"role": "user", "content": prompt}]}
-            ):
-            if "tools" in chunk:
-                tool_outputs.extend(chunk["tools"]["messages"])
-            if "agent" in chunk:
-                # The agent's message is the latest one in the list
-                message = chunk["agent"]["messages"][-1]
-                # If it's a final response (no more tool calls), we save it.
-                if not message.tool_calls:
-                    agent_final_response = message
-
-        # Render the collected outputs. Prioritize tool output.
-        if tool_outputs:
-            # To make the output identical, we remove the "Tool output:" header
-            for msg in tool_outputs:
-                mock_result = ToolResult(content=[TextContent(text=msg.content)], isError=False)
-                render_utility_result(mock_result)
-        elif agent_final_response:
-            # Only if no tool was called, print the agent's response.
-            print(agent_final_response.content)
+    async with make_http_client() as http_client:
+        # Spawn the MCP server and open the OpenAI connection at the same time.
+        tools, _ = await asyncio.gather(
+            cached_get_tools(client, "syncable_cli", refresh=refresh),
+            warm_openai(http_client),
+        )
+        tool_names = [t.name for t in tools]
+        if os.environ.get("MCP_VERBOSE"):
+            sys.stdout.write(f"Fetched {len(tools)} tools:\n" + "".join(f" • {name}\n" for name in tool_names))
+        else:
+            print(f"Fetched {len(tools)} tools.")
+
+        agent = create_react_agent(ChatOpenAI(model=MODEL, http_async_client=http_client), tools)
+
+        # Run the tests concurrently; each renders its output as it streams in.
+        await asyncio.gather(*(
+            run_test(agent, name, prompt, payload, cache_key(payload, MODEL, tool_names), use_cache, refresh)
+            for name, prompt, payload in INPUTS
+        ))
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    args = parse_cache_args()
+    run_async(main(refresh=args.refresh, use_cache=args.use_cache))
\ No newline at end of file
@@ -2,7 +2,7 @@ import asyncio
 import json
 from mcp.client.session import ClientSession
 from mcp.client.stdio import StdioServerParameters, stdio_client
-from .utils import render_utility_result
+from .utils import render_utility_result, run_async
 
 # to start the server, run:
 # from cpr-rust-server folder cargo run --release 
@@ -15,29 +15,33 @@ async def main():
         async with ClientSession(read, write) as session:
             await session.initialize()
 
-            # List available tools
-            tools = await session.list_tools()
+            # Listing the tools and the scans don't depend on each other, so
+            # issue them together; the session matches each response to its
+            # request id.
+            tools, about_info_result, code_analyze_result, security_scan_result, dependency_scan_result = (
+                await asyncio.gather(
+                    session.list_tools(),
+                    session.call_tool("about_info", {}),
+                    session.call_tool("analysis_scan", {"path": "../", "display": "summary"}),
+                    session.call_tool("security_scan", {"path": "../"}),
+                    session.call_tool("dependency_scan", {"path": "../"}),
+                )
+            )
+
             print("Tools:")
             render_utility_result(tools)
 
-            # Call the 'about info' tool
-            about_info_result = await session.call_tool("about_info", {})
             print("About info result:")
             render_utility_result(about_info_result)
 
-            code_analyze_result = await session.call_tool("analysis_scan", {"path": "../", "display": "summary"})
             print("Code analysis result:")
             render_utility_result(code_analyze_result)
 
-            # Call the 'security scan' tool
-            security_scan_result = await session.call_tool("security_scan", {"path": "../"})
             print("Security scan result:")
             render_utility_result(security_scan_result)
 
-            # Call the 'dependency scan' tool
-            dependency_scan_result = await session.call_tool("dependency_scan", {"path": "../"})
             print("Dependency scan result:")
             render_utility_result(dependency_scan_result)
 
 
-asyncio.run(main())
\ No newline at end of file
+run_async(main())
\ No newline at end of file
@@ -0,0 +1,112 @@
+"""
+A small on-disk cache of agent responses for the LangGraph demos.
+
+The demo prompts never change, so once a prompt has been answered for a given
+model and tool set, later runs can replay the stored messages instead of
+paying for the LLM and tool calls again. Entries expire after an hour, since
+the scanned files and the server can change underneath them.
+"""
+
+import hashlib
+import json
+import time
+
+from .utils import CACHE_DIR, json_loads, write_atomic
+
+try:
+    from orjson import dumps as _orjson_dumps
+
+    def _json_bytes(obj):
+        return _orjson_dumps(obj, default=str)
+except ImportError:
+    def _json_bytes(obj):
+        return json.dumps(obj, default=str).encode()
+
+RESPONSE_CACHE_DIR = CACHE_DIR / "resp"
+RESPONSE_CACHE_TTL = 60 * 60  # seconds
+
+
+def cache_key(payload, model_id, tool_names):
+    """Hashes everything that determines the agent's response to `payload`."""
+    blob = json.dumps([payload, model_id, sorted(tool_names)], sort_keys=True).encode()
+    return hashlib.blake2b(blob, digest_size=16).hexdigest()
+
+
+def hit_note(age):
+    """Describes a replayed entry of the given age (in seconds) for the demo output."""
+    return f"replaying a cached response from {int(age // 60)} min ago (--refresh re-runs it)"
+
+
+def load(key):
+    """
+    Returns the cached agent state for `key` and its age in seconds, or None if
+    there is no usable entry (missing, expired or unreadable).
+    """
+    from langchain_core.messages import messages_from_dict
+
+    cache_path = RESPONSE_CACHE_DIR / f"{key}.json"
+    try:
+        age = time.time() - cache_path.stat().st_mtime
+        if age >= RESPONSE_CACHE_TTL:
+            return None
+        data = json_loads(cache_path.read_bytes())
+        return {"messages": messages_from_dict(data["messages"])}, age
+    except FileNotFoundError:
+        return None
+    except (ValueError, KeyError, TypeError):
+        # A corrupt or outdated entry is a miss; the next live run replaces it.
+        return None
+
+
+def store(key, state):
+    """Writes the agent state (its message history) for `key` to the cache."""
+    from langchain_core.messages import messages_to_dict
+
+    data = {"messages": messages_to_dict(state["messages"])}
+    write_atomic(RESPONSE_CACHE_DIR / f"{key}.json", _json_bytes(data))
+
+
+async def cached_astream(agent, payload, key, *, use_cache=True, refresh=False, stream_mode="updates", on_hit=None):
+    """
+    Like `agent.astream(payload, stream_mode=...)` for a `create_react_agent`
+    graph, with "updates" or "values" chunks. On a cache hit the stored run is
+    replayed: as "agent"/"tools" update chunks, or as one final state for
+    "values". On a miss the live run is recorded, unless a tool call in it
+    failed. Pass refresh=True to skip the lookup but still record the run, or
+    use_cache=False to bypass the cache entirely. `on_hit`, if given, is awaited
+    with the entry's age in seconds before a replay, so callers can say that
+    the output is not live.
+    """
+    from langchain_core.messages import AIMessage, ToolMessage, convert_to_messages
+
+    prompt_messages = convert_to_messages(payload["messages"])
+
+    if use_cache and not refresh:
+        cached = load(key)
+        if cached is not None:
+            state, age = cached
+            if on_hit is not None:
+                await on_hit(age)
+            if stream_mode == "values":
+                yield state
+                return
+            for message in state["messages"][len(prompt_messages):]:
+                if isinstance(message, ToolMessage):
+                    yield {"tools": {"messages": [message]}}
+                elif isinstance(message, AIMessage):
+                    yield {"agent": {"messages": [message]}}
+            return
+
+    messages = list(prompt_messages)
+    async for chunk in agent.astream(payload, stream_mode=stream_mode):
+        if use_cache:
+            if stream_mode == "values":
+                messages = chunk["messages"]
+            else:
+                for update in chunk.values():
+                    messages.extend((update or {}).get("messages", ()))
+        yield chunk
+    # Don't keep a run that a transient tool failure went into.
+    failed = any(isinstance(m, ToolMessage) and m.status == "error" for m in messages)
+    if use_cache and not failed:
+        store(key, {"messages": messages})
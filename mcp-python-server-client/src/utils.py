@@ -1,10 +1,92 @@
+import argparse
+import asyncio
+import hashlib
 import json
-from pprint import pprint
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+from functools import lru_cache
+from pathlib import Path
+import httpx
 from rich.console import Console
 from rich.json import JSON
 from rich.panel import Panel
 
+try:
+    # orjson decodes large reports several times faster than the stdlib.
+    # Its JSONDecodeError subclasses json.JSONDecodeError.
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+try:
+    # libuv-based event loop; not available on Windows.
+    import uvloop
+except ImportError:
+    uvloop = None
+
 console = Console()
+# Bound once; render_utility_result prints through it on every call.
+_print = console.print
+
+CACHE_DIR = Path.home() / ".cache" / "syncable-mcp"
+TOOLS_CACHE_TTL = 60 * 60  # seconds
+
+# Returned by _parse_report for tool output that is not JSON.
+NOT_JSON = object()
+
+# JSON tool outputs (including a report string inside a JSON string) start with
+# one of these characters after any leading whitespace.
+_JSON_START = re.compile(r'\s*["{\[]')
+
+def dump(obj):
+    """
+    Writes a raw result to stdout in a single call. MCP results are pydantic
+    models and serialize to indented JSON natively; anything else is written
+    as its repr.
+    """
+    if hasattr(obj, "model_dump_json"):
+        text = obj.model_dump_json(indent=2)
+    else:
+        text = repr(obj)
+    sys.stdout.write(text + "\n")
+
+
+def _parse_report(text_content):
+    """
+    Decodes a tool's text output, or returns NOT_JSON for raw, pre-formatted
+    strings.
+    """
+    # Anything else is a raw, pre-formatted string (like the output from the
+    # 'about_info' tool with ANSI codes), so skip the parse and the exception it
+    # would raise. Matching in place avoids lstrip() copying the whole text.
+    if not _JSON_START.match(text_content):
+        return NOT_JSON
+    try:
+        return json_loads(text_content)
+    except json.JSONDecodeError:
+        return NOT_JSON
+
+
+@lru_cache(maxsize=64)
+def _report_panel(text_content):
+    """
+    Builds the panel that displays a tool's text output. Cached by text, so
+    identical outputs (an agent calling the same tool again, or a result shown
+    twice) are parsed and laid out only once. Rich renderables can be printed
+    any number of times.
+    """
+    report_data = _parse_report(text_content)
+    if report_data is NOT_JSON:
+        return Panel(text_content, title="📄 Tool Response", border_style="green")
+    # Pretty print JSON with rich syntax highlighting and colors. from_data
+    # encodes the decoded report once; JSON(text) would parse it again first.
+    json_obj = JSON.from_data(report_data)
+    return Panel(json_obj, title="📋 Tool Response", border_style="blue")
+
 
 def render_utility_result(result):
     """
@@ -14,24 +96,143 @@ def render_utility_result(result):
     """
     if not result or not hasattr(result, 'content') or getattr(result, 'isError', False):
         print("Invalid or error result.")
-        pprint(result)
+        dump(result)
         return
 
     try:
         # The result is a single TextContent object
         text_content = result.content[0].text
-        try:
-            # First, try to load as JSON. This handles tool outputs that
-            # are JSON-encoded strings (e.g., a report string inside a JSON string).
-            report_data = json.loads(text_content)
-            # Pretty print JSON with rich syntax highlighting and colors
-            json_obj = JSON(json.dumps(report_data, ensure_ascii=False))
-            console.print(Panel(json_obj, title="📋 Tool Response", border_style="blue"))
-        except json.JSONDecodeError:
-            # If JSON decoding fails, assume it's a raw, pre-formatted string
-            # (like the output from the 'about_info' tool with ANSI codes).
-            console.print(Panel(text_content, title="📄 Tool Response", border_style="green"))
     except (IndexError, AttributeError) as e:
         print(f"Error parsing result: {e}")
         print("Printing raw result instead:")
-        pprint(result)
+        dump(result)
+        return
+
+    _print(_report_panel(text_content))
+
+
+async def render_utility_result_async(result):
+    """
+    Like render_utility_result, but parses and renders in a worker thread so
+    a large report doesn't stall the event loop while other calls are in flight.
+    """
+    await asyncio.to_thread(render_utility_result, result)
+
+
+def load_env():
+    """Reads .env into the environment unless OPENAI_API_KEY is already set."""
+    if not os.environ.get("OPENAI_API_KEY"):
+        from dotenv import load_dotenv
+        load_dotenv()
+
+
+def parse_cache_args():
+    """Parses the cache flags shared by the LangGraph demos."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--refresh", action="store_true",
+                        help="re-fetch the tool list and re-run the prompts, updating the caches")
+    parser.add_argument("--no-cache", dest="use_cache", action="store_false",
+                        help="query the agent without reading or writing cached responses")
+    return parser.parse_args()
+
+
+def run_async(main):
+    """
+    Runs the `main` coroutine to completion on uvloop when it is installed,
+    falling back to asyncio's default event loop otherwise.
+    """
+    if uvloop is not None:
+        return uvloop.run(main)
+    return asyncio.run(main)
+
+
+def make_http_client():
+    """
+    Creates a pooled httpx.AsyncClient to share across the OpenAI calls of a
+    demo run. It speaks HTTP/2, so concurrent requests multiplex over a single
+    kept-alive connection instead of each opening its own.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        timeout=60,
+    )
+
+
+async def warm_openai(http_client):
+    """
+    Opens a connection to the OpenAI API on `http_client` ahead of the first
+    real request, so the TCP/TLS handshake can overlap other startup work.
+    """
+    base_url = os.environ.get("OPENAI_BASE_URL", "https://api.openai.com/v1")
+    try:
+        await http_client.head(f"{base_url}/models")
+    except httpx.HTTPError:
+        # Warming up is best-effort; the real request will report any problem.
+        pass
+
+
+def write_atomic(path, data):
+    """
+    Writes `data` (bytes) to `path` through a temporary file in the same
+    directory, so an interrupted run never leaves a truncated cache entry.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+async def cached_get_tools(client, server_name, *, refresh=False):
+    """
+    Returns the LangChain tools exposed by `server_name` on a MultiServerMCPClient.
+    The server's tool definitions are cached on disk, keyed by its connection
+    config (and, for stdio, the server binary's mtime), so warm runs skip the
+    list_tools round-trips. Pass refresh=True to ignore the cache and fetch
+    them from the server again.
+    """
+    from langchain_mcp_adapters.tools import convert_mcp_tool_to_langchain_tool
+    from mcp.types import Tool
+
+    connection = client.connections[server_name]
+    key_data = dict(connection)
+    if connection.get("transport") == "stdio":
+        # An upgraded server binary may expose different tools.
+        executable = shutil.which(connection["command"])
+        key_data["command_mtime"] = os.stat(executable).st_mtime if executable else None
+    key = hashlib.sha256(json.dumps(key_data, sort_keys=True, default=str).encode()).hexdigest()
+    cache_path = CACHE_DIR / f"tools-{key[:16]}.json"
+
+    definitions = None
+    if not refresh:
+        try:
+            if time.time() - cache_path.stat().st_mtime < TOOLS_CACHE_TTL:
+                definitions = [Tool.model_validate(tool) for tool in json.loads(cache_path.read_text())]
+        except FileNotFoundError:
+            pass
+        except (ValueError, TypeError):
+            # A corrupt entry is a miss; it is rewritten below.
+            pass
+
+    if definitions is None:
+        definitions = []
+        async with client.session(server_name) as session:
+            cursor = None
+            while True:
+                page = await session.list_tools(cursor=cursor)
+                definitions.extend(page.tools)
+                cursor = page.nextCursor
+                if cursor is None:
+                    break
+        write_atomic(cache_path, json.dumps([tool.model_dump(mode="json") for tool in definitions]).encode())
+
+    # Without a session, each tool opens its own connection when it is called.
+    return [
+        convert_mcp_tool_to_langchain_tool(None, tool, connection=connection)
+        for tool in definitions
+    ]
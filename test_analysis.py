@@ -7,6 +7,19 @@ import os
 from mcp.client.session import ClientSession
 from mcp.client.stdio import StdioServerParameters, stdio_client
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from uvloop import run
+except ImportError:
+    from asyncio import run
+
+# Set MCP_DEBUG=1 to dump the structure of the result and tracebacks as well.
+DEBUG = bool(os.environ.get("MCP_DEBUG"))
+
 async def test_analysis():
     # Ensure we're in the right directory
     server_path = "./rust-mcp-server-syncable-cli/target/release/mcp-stdio"
@@ -18,39 +31,62 @@ async def test_analysis():
     print(f"Using server binary: {server_path}")
     
     try:
-        async with stdio_client(
-            StdioServerParameters(command=server_path)
-        ) as (read, write):
-            async with ClientSession(read, write) as session:
-                print("Initializing session...")
-                await session.initialize()
-                print("Session initialized")
-
-                print("Calling analysis_scan tool...")
-                # Add a timeout to prevent hanging
-                result = await asyncio.wait_for(
-                    session.call_tool("analysis_scan", {"path": "./rust-mcp-server-syncable-cli", "display": "matrix"}),
-                    timeout=30.0  # 30 second timeout
-                )
-                print("Analysis result received:")
-                print(f"Result type: {type(result)}")
-                print(f"Result attributes: {dir(result)}")
-                if hasattr(result, 'content'):
-                    print(f"Content length: {len(result.content)}")
-                    for i, content in enumerate(result.content):
-                        print(f"Content[{i}]: {type(content)}")
-                        if hasattr(content, 'text'):
-                            print(f"Text length: {len(content.text)}")
-                            print(f"First 500 chars: {content.text[:500]}")
-                print("Full result:")
-                print(json.dumps(result, indent=2, default=str))
-                
+        # One 30 second deadline covers the handshake and the call, so neither
+        # can hang. It wraps the client so the TimeoutError isn't raised inside
+        # (and wrapped by) the client's task groups.
+        async with asyncio.timeout(30):
+            async with stdio_client(
+                StdioServerParameters(command=server_path)
+            ) as (read, write):
+                async with ClientSession(read, write) as session:
+                    print("Initializing session...")
+                    await session.initialize()
+                    print("Session initialized")
+
+                    print("Calling analysis_scan tool...")
+                    result = await session.call_tool(
+                        "analysis_scan", {"path": "./rust-mcp-server-syncable-cli", "display": "matrix"}
+                    )
+        # Collect the report and write it out in one go.
+        lines = ["Analysis result received:", f"Is error: {result.isError}"]
+        if DEBUG:
+            lines.append(f"Result type: {type(result)}")
+            lines.append(f"Content length: {len(result.content)}")
+        for i, content in enumerate(result.content):
+            if DEBUG:
+                lines.append(f"Content[{i}]: {type(content)}")
+            if hasattr(content, 'text'):
+                lines.append(f"Text length: {len(content.text)}")
+                lines.append(f"First 500 chars: {content.text[:500]}")
+        if DEBUG:
+            lines.append("Full result:")
+            # The result is a pydantic model; neither encoder can walk it
+            # directly, so dump it to plain JSON types first.
+            data = result.model_dump(mode="json")
+            if orjson is None:
+                lines.append(json.dumps(data, indent=2))
+        sys.stdout.write("\n".join(lines) + "\n")
+        if DEBUG and orjson is not None:
+            # orjson produces UTF-8 bytes; write them to the
+            # underlying buffer rather than decoding for print.
+            sys.stdout.flush()
+            sys.stdout.buffer.write(orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+            ))
+
     except asyncio.TimeoutError:
-        print("Timeout: The analysis tool took too long to respond")
+        print("Timeout: The server took too long to respond")
     except Exception as e:
-        print(f"Error: {e}")
-        import traceback
-        traceback.print_exc()
+        # The client's task groups wrap errors in ExceptionGroups; report the
+        # underlying exception rather than "unhandled errors in a TaskGroup".
+        cause = e
+        while isinstance(cause, ExceptionGroup) and cause.exceptions:
+            cause = cause.exceptions[0]
+        sys.stderr.write(f"Error: {type(cause).__name__}: {cause}\n")
+        if DEBUG:
+            import traceback
+            for line in traceback.TracebackException.from_exception(e).format():
+                sys.stderr.write(line)
 
 if __name__ == "__main__":
-    asyncio.run(test_analysis())
\ No newline at end of file
+    run(test_analysis())
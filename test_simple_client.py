@@ -3,9 +3,15 @@
 
 import asyncio
 import json
+import sys
 from mcp.client.session import ClientSession
 from mcp.client.stdio import StdioServerParameters, stdio_client
 
+try:
+    from uvloop import run
+except ImportError:
+    from asyncio import run
+
 async def test_tools():
     async with stdio_client(
         StdioServerParameters(command="rust-mcp-server-syncable-cli/target/release/mcp-stdio")
@@ -13,29 +19,28 @@ async def test_tools():
         async with ClientSession(read, write) as session:
             await session.initialize()
             
-            print("Testing about_info...")
-            try:
-                about_result = await session.call_tool("about_info", {})
-                print("✅ about_info succeeded")
-                print(f"Response length: {len(str(about_result))}")
-            except Exception as e:
-                print(f"❌ about_info failed: {e}")
-            
-            print("\nTesting security_scan...")
-            try:
-                security_result = await session.call_tool("security_scan", {"path": "."})
-                print("✅ security_scan succeeded")
-                print(f"Response length: {len(str(security_result))}")
-            except Exception as e:
-                print(f"❌ security_scan failed: {e}")
-            
-            print("\nTesting analysis_scan...")
-            try:
-                analysis_result = await session.call_tool("analysis_scan", {"path": ".", "display": "summary"})
-                print("✅ analysis_scan succeeded")
-                print(f"Response length: {len(str(analysis_result))}")
-            except Exception as e:
-                print(f"❌ analysis_scan failed: {e}")
+            tests = [
+                ("about_info", {}),
+                ("security_scan", {"path": "."}),
+                ("analysis_scan", {"path": ".", "display": "summary"}),
+            ]
+            # Run the calls concurrently; a failing call comes back as its
+            # exception instead of cancelling the others.
+            results = await asyncio.gather(
+                *(session.call_tool(name, args) for name, args in tests),
+                return_exceptions=True,
+            )
+
+            lines = []
+            for (name, _), result in zip(tests, results):
+                lines.append(f"Testing {name}...")
+                if isinstance(result, Exception):
+                    lines.append(f"❌ {name} failed: {result}")
+                else:
+                    lines.append(f"✅ {name} succeeded")
+                    lines.append(f"Response length: {len(str(result))}")
+                lines.append("")
+            sys.stdout.write("\n".join(lines))
 
 if __name__ == "__main__":
-    asyncio.run(test_tools())
\ No newline at end of file
+    run(test_tools())